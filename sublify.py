@@ -7,8 +7,11 @@ Features
 - Picks the best matching subtitle using `subliminal`
 - Supports multiple languages (ISO 639-1 like "en", "fr" or BCP-47 like "pt-BR")
 - Optional OpenSubtitles login via env vars (OPENSUBTITLES_USERNAME / OPENSUBTITLES_PASSWORD)
-- Respects existing subtitles unless --force is set
+- Respects existing subtitles unless --force is set (only missing languages are fetched)
 - Dry-run mode to preview what would be downloaded
+- Processes several videos in parallel (--concurrency)
+- Per-provider rate limiting with retry/backoff on HTTP 429
+- Duplicate videos (hardlinks, copies) reuse already downloaded subtitles
 
 Install (recommended in a fresh environment):
     pip install subliminal babelfish click dogpile.cache pysrt
@@ -34,87 +37,696 @@ Examples
     python sublify.py "D:/Movies" -r
 
 Notes
+- Provider lookups are cached for a week in ~/.cache/sublify/subliminal.dbm
+  (or in Redis when SUBLIFY_REDIS_URL is set, e.g. redis://host:6379/0).
 - Providers used by default: OpenSubtitles, Podnapisi, TVSubtitles.
 - You can customize providers with --provider multiple times.
 - Some providers require accounts; OpenSubtitles works better when logged in.
 """
 from __future__ import annotations
 
+import json
 import os
+import queue
+import shutil
+import stat
 import sys
+import threading
 import time
+import xmlrpc.client
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List, Set, Dict
+from types import MappingProxyType
+from typing import Iterable, Iterator, FrozenSet, List, Mapping, Optional, Set, Dict, Tuple
+from urllib.parse import urlsplit
 
 import click
-from babelfish import Language
+import requests
+from babelfish import Error as BabelfishError, Language, LanguageReverseError
+from dogpile.cache.backends.file import AbstractFileLock
+from dogpile.util.readwrite_lock import ReadWriteMutex
 from subliminal import (
+    Video,
     scan_video,
-    download_best_subtitles,
     save_subtitles,
     region,
 )
+from subliminal.core import AsyncProviderPool
+from subliminal.providers import TimeoutSafeTransport
+from subliminal.refiners.hash import hash_functions as HASH_FUNCTIONS, refine as refine_hashes
+from subliminal.utils import hash_opensubtitles
+from urllib3.exceptions import ProtocolError
 
-# Configure subliminal caching to speed up repeated runs
-region.configure("dogpile.cache.memory")
+# Windows and default macOS volumes match file names case-insensitively
+CASE_INSENSITIVE_FS = sys.platform in ("win32", "darwin")
+
+# Persistent cache location for provider/refiner responses
+CACHE_DIR = Path.home() / ".cache" / "sublify"
+CACHE_EXPIRATION = 60 * 60 * 24 * 7  # one week
 
 # Common video file extensions
 VIDEO_EXTS = {".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".ts", ".m2ts"}
+VIDEO_EXT_TUPLE = tuple(VIDEO_EXTS)  # for str.endswith on lowercased names
+
+# Provider limits as (requests per second, burst)
+# OpenSubtitles allows 40 requests / 10 s per IP; Addic7ed throttles far harder.
+# Podnapisi and TVSubtitles publish no limit, so they get a conservative one.
+PROVIDER_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    "opensubtitles": (4.0, 8),
+    "addic7ed": (0.5, 1),
+    "podnapisi": (2.0, 4),
+    "tvsubtitles": (2.0, 4),
+}
+
+# Host (or parent domain) -> rate-limit bucket
+PROVIDER_HOSTS = {
+    "opensubtitles.com": "opensubtitles",
+    "opensubtitles.org": "opensubtitles",
+    "addic7ed.com": "addic7ed",
+    "podnapisi.net": "podnapisi",
+    "tvsubtitles.net": "tvsubtitles",
+}
+
+# Retries on HTTP 429 / dropped connections, backing off 1s -> 2s -> 4s
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+
+
+class RateLimiter:
+    """Thread-safe token bucket per provider.
+
+    Buckets refill at the configured rate and are drained early when a provider
+    reports `X-RateLimit-Remaining` or asks us to wait via `Retry-After`.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]]):
+        now = time.monotonic()
+        self._limits = dict(limits)
+        self._tokens = {name: float(burst) for name, (_, burst) in limits.items()}
+        self._stamps = {name: now for name in limits}
+        self._blocked_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, name: str) -> None:
+        """Block until a request to provider `name` is allowed."""
+        if name not in self._limits:
+            return
+        rate, burst = self._limits[name]
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens = min(burst, self._tokens[name] + (now - self._stamps[name]) * rate)
+                self._stamps[name] = now
+                pause = self._blocked_until.get(name, 0.0) - now
+                if pause <= 0 and tokens >= 1:
+                    self._tokens[name] = tokens - 1
+                    return
+                self._tokens[name] = tokens
+                if pause <= 0:
+                    pause = (1 - tokens) / rate
+            time.sleep(pause)
+
+    def update(self, name: str, headers) -> None:
+        """Adjust the bucket of `name` from rate-limit response headers."""
+        if name not in self._limits:
+            return
+        remaining = headers.get("X-RateLimit-Remaining")
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+        with self._lock:
+            if remaining is not None and remaining.strip().isdigit():
+                self._tokens[name] = min(self._tokens[name], float(remaining))
+            if retry_after:
+                until = time.monotonic() + retry_after
+                self._blocked_until[name] = max(self._blocked_until.get(name, 0.0), until)
+
+
+class MutexLock(AbstractFileLock):
+    """In-process lock for the dbm cache (fcntl file locks are not available on Windows)."""
+
+    def __init__(self, filename: str):
+        self.mutex = ReadWriteMutex()
+
+    def acquire_read_lock(self, wait: bool) -> bool:
+        ret = self.mutex.acquire_read_lock(wait)
+        return wait or ret
+
+    def acquire_write_lock(self, wait: bool) -> bool:
+        ret = self.mutex.acquire_write_lock(wait)
+        return wait or ret
+
+    def release_read_lock(self) -> None:
+        self.mutex.release_read_lock()
+
+    def release_write_lock(self) -> None:
+        self.mutex.release_write_lock()
+
+
+def configure_cache() -> None:
+    """Configure subliminal caching so repeated runs skip provider/refiner lookups.
+
+    Uses a shared Redis cache when SUBLIFY_REDIS_URL is set, else a dbm file under CACHE_DIR.
+    """
+    redis_url = os.getenv("SUBLIFY_REDIS_URL")
+    if redis_url:
+        region.configure(
+            "dogpile.cache.redis",
+            expiration_time=CACHE_EXPIRATION,
+            arguments={"url": redis_url, "distributed_lock": True},
+        )
+        return
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    arguments = {"filename": str(CACHE_DIR / "subliminal.dbm")}
+    if os.name == "nt":
+        # dogpile's default fcntl file lock also guards against concurrent runs; keep it elsewhere
+        arguments["lock_factory"] = MutexLock
+    region.configure("dogpile.cache.dbm", expiration_time=CACHE_EXPIRATION, arguments=arguments)
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return 0.0  # HTTP-date form; fall back to exponential backoff
+
+
+def _provider_for_url(url: str) -> Optional[str]:
+    host = (urlsplit(url).hostname or "").lower()
+    for domain, name in PROVIDER_HOSTS.items():
+        if host == domain or host.endswith("." + domain):
+            return name
+    return None
+
+
+def install_rate_limiter(limiter: RateLimiter) -> None:
+    """Throttle every provider call and retry 429s / protocol errors.
+
+    Covers both `requests`-based providers and the XML-RPC transport used by OpenSubtitles.
+    """
+    original_send = requests.Session.send
+    if getattr(original_send, "_sublify_limited", False):
+        return
+    original_request = TimeoutSafeTransport.request
+
+    def send(self, request, **kwargs):
+        name = _provider_for_url(request.url)
+        for attempt in range(RETRY_ATTEMPTS + 1):
+            if name:
+                limiter.acquire(name)
+            try:
+                response = original_send(self, request, **kwargs)
+            except requests.exceptions.ConnectionError as e:
+                dropped = bool(e.args) and isinstance(e.args[0], ProtocolError)
+                if not dropped or attempt == RETRY_ATTEMPTS:
+                    raise
+            else:
+                if name:
+                    limiter.update(name, response.headers)
+                if response.status_code != 429 or attempt == RETRY_ATTEMPTS:
+                    return response
+                response.close()
+            time.sleep(RETRY_BASE_DELAY * 2 ** attempt)
+
+    def request(self, host, handler, request_body, verbose=False):
+        name = _provider_for_url("//" + host)
+        for attempt in range(RETRY_ATTEMPTS + 1):
+            if name:
+                limiter.acquire(name)
+            try:
+                return original_request(self, host, handler, request_body, verbose)
+            except xmlrpc.client.ProtocolError as e:
+                if name and e.headers:
+                    limiter.update(name, e.headers)
+                if e.errcode != 429 or attempt == RETRY_ATTEMPTS:
+                    raise
+            time.sleep(RETRY_BASE_DELAY * 2 ** attempt)
+
+    send._sublify_limited = True
+    requests.Session.send = send
+    TimeoutSafeTransport.request = request
+
+
+def _name_key(name: str) -> str:
+    """Normalize a file name for listing lookups, matching the filesystem's case rules."""
+    return name.lower() if CASE_INSENSITIVE_FS else name
+
+
+def _scan_dir(directory: str, recursive: bool) -> Tuple[List[Path], List[str], FrozenSet[str]]:
+    """Scan one folder with os.scandir; return its video files, the subfolders to visit
+    and the names of all its entries (see _name_key).
+
+    DirEntry type checks reuse the d_type returned by readdir, so non-video entries
+    cost no extra syscalls and Paths are only built for matches. Hidden folders are skipped.
+    """
+    files: List[Path] = []
+    subdirs: List[str] = []
+    names: List[str] = []
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        return files, subdirs, frozenset()
+    with it:
+        for entry in it:
+            name = entry.name
+            names.append(_name_key(name))
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and not name.startswith("."):
+                    subdirs.append(entry.path)
+                continue
+            # d_type answers is_file() for regular files; only symlinks cost a stat
+            if name.lower().endswith(VIDEO_EXT_TUPLE) and entry.is_file():
+                files.append(Path(entry.path))
+    return files, subdirs, frozenset(names)
+
 
+def _walk_dirs(roots: List[str], recursive: bool, threads: int,
+               listings: Dict[Path, FrozenSet[str]]) -> List[Path]:
+    """Scan folders on a thread pool so readdir latency (NFS/SMB) overlaps.
 
-def resolve_videos(targets: Iterable[Path], recursive: bool) -> List[Path]:
-    """Return a list of video file paths from targets.
+    Each finished folder feeds its subfolders back into the pool; the walk ends
+    when no scans are pending. Folder contents are recorded in `listings`.
+    """
+    files: List[Path] = []
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        pending = {executor.submit(_scan_dir, root, recursive): root for root in roots}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                directory = pending.pop(fut)
+                found, subdirs, names = fut.result()
+                files.extend(found)
+                listings[Path(directory)] = names
+                for d in subdirs:
+                    pending[executor.submit(_scan_dir, d, recursive)] = d
+    return files
+
+
+def resolve_videos(targets: Iterable[Path], recursive: bool, scan_threads: int = 16,
+                   listings: Optional[Dict[Path, FrozenSet[str]]] = None) -> List[Path]:
+    """Return a list of video file paths from targets, grouped by folder.
     If a target is a directory, include files inside (optionally recursively).
+    Names found in each scanned folder are stored in `listings` when given.
     """
     files: List[Path] = []
+    dirs: List[str] = []
     for t in targets:
-        if t.is_file() and t.suffix.lower() in VIDEO_EXTS:
+        try:
+            mode = os.stat(t).st_mode  # one stat instead of is_file() + is_dir()
+        except OSError:
+            continue
+        if stat.S_ISREG(mode) and t.name.lower().endswith(VIDEO_EXT_TUPLE):
             files.append(t)
-        elif t.is_dir():
-            if recursive:
-                for p in t.rglob("*"):
-                    if p.is_file() and p.suffix.lower() in VIDEO_EXTS:
-                        files.append(p)
-            else:
-                for p in t.glob("*"):
-                    if p.is_file() and p.suffix.lower() in VIDEO_EXTS:
-                        files.append(p)
-    return sorted(files)
+        elif stat.S_ISDIR(mode):
+            dirs.append(str(t))
+    if dirs:
+        files.extend(_walk_dirs(dirs, recursive, scan_threads, {} if listings is None else listings))
+    return sorted(files, key=lambda p: (p.parent, p.name))
+
+
+def _dir_listing(directory: Path, listings: Dict[Path, FrozenSet[str]]) -> FrozenSet[str]:
+    """File names in `directory`, taken from the scan or read once with scandir."""
+    names = listings.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as it:
+                names = frozenset(_name_key(entry.name) for entry in it)
+        except OSError:
+            names = frozenset()
+        listings[directory] = names
+    return names
+
+
+def missing_languages(video_path: Path, lang_suffixes: Dict[Language, str],
+                      listings: Dict[Path, FrozenSet[str]]) -> Set[Language]:
+    """Return the requested languages that do not have a subtitle next to the video yet.
 
+    `lang_suffixes` maps each language to its precomputed ".<lang>.srt" suffix and
+    `listings` caches folder contents, so checks are set lookups instead of stat() calls.
+    """
+    names = _dir_listing(video_path.parent, listings)
+    stem = video_path.stem
+    # A plain <name>.srt is assumed to be in the language asked for when only one is requested
+    if len(lang_suffixes) == 1 and _name_key(stem + ".srt") in names:
+        return set()
+    # subliminal typically saves as <name>.<lang>.srt (e.g., movie.en.srt)
+    return {lang for lang, suffix in lang_suffixes.items() if _name_key(stem + suffix) not in names}
+
+
+_LANGUAGE_PARSERS = (
+    lambda x: Language(x),  # tries common forms like 'eng'
+    Language.fromalpha2,
+    Language.fromalpha3b,
+    Language.fromalpha3t,
+    Language.fromietf,      # e.g., 'pt-BR'
+)
 
-def has_existing_subtitles(video_path: Path, languages: Set[Language]) -> bool:
-    base = video_path.with_suffix("")
-    for lang in languages:
-        # subliminal typically saves as <name>.<lang>.srt (e.g., movie.en.srt)
-        srt_lang = base.with_suffix(f".{lang}.srt")
-        srt_plain = base.with_suffix(".srt")
-        if srt_lang.exists() or srt_plain.exists():
-            return True
-    return False
+
+def _parse_language(code: str) -> Optional[Language]:
+    """Parse one language code, picking the parser from the code's shape.
+
+    Falls back to trying every parser only when the direct pick fails.
+    """
+    try:
+        if "-" in code:
+            return Language.fromietf(code)
+        if len(code) == 2:
+            return Language.fromalpha2(code)
+        if len(code) == 3:
+            try:
+                return Language.fromalpha3b(code)
+            except LanguageReverseError:
+                return Language.fromalpha3t(code)
+        return Language(code)
+    except (BabelfishError, ValueError):
+        pass
+    for parser in _LANGUAGE_PARSERS:
+        try:
+            return parser(code)
+        except Exception:
+            continue
+    return None
 
 
 def _lang_list_to_babelfish(langs: List[str]) -> Set[Language]:
     out: Set[Language] = set()
     for l in langs:
-        parsed = None
-        for parser in (
-            lambda x: Language(x),  # tries common forms like 'en'
-            Language.fromalpha2,
-            Language.fromalpha3b,
-            Language.fromalpha3t,
-            Language.fromietf,      # e.g., 'pt-BR'
-        ):
-            try:
-                parsed = parser(l)
-                break
-            except Exception:
-                continue
+        parsed = _parse_language(l)
         if not parsed:
             raise click.BadParameter(f"Invalid language code: {l}")
         out.add(parsed)
     return out
 
 
+class _JsonStore:
+    """Thread-safe dict persisted as a JSON file under CACHE_DIR."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._entries: Dict[str, object] = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp, self.path)
+            self._dirty = False
+
+
+class VideoCache(_JsonStore):
+    """On-disk cache of video hashes, keyed by path and validated by size and mtime.
+
+    scan_video only guesses from the name, so provider hashes and the duplicate
+    fingerprint (an OpenSubtitles hash) are computed here. A hit still guesses from
+    the name (as scan_video does) but restores the stored hashes instead of
+    re-reading the start and end of the file.
+    """
+
+    def scan(self, vid_path: Path, providers: List[str]) -> Tuple[Optional[Video], Optional[str]]:
+        """Return the scanned video and its fingerprint (None for files too small to hash)."""
+        key = os.path.abspath(vid_path)
+        st = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+        hit = bool(entry) and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns
+        if hit:
+            video = Video.fromname(key)
+            video.size = entry["size"]
+            video.hashes = dict(entry["hashes"])
+            fingerprint = entry.get("fingerprint")
+        else:
+            video = scan_video(key)
+            fingerprint = None
+        if not video:
+            return video, None
+
+        # Only hash for providers that use hashes and were not covered by a previous run
+        unhashed = [p for p in providers if p in HASH_FUNCTIONS and p not in video.hashes]
+        known = dict(video.hashes)
+        if unhashed:
+            refine_hashes(video, providers=unhashed)
+        if not hit:
+            fingerprint = video.hashes.get("opensubtitles") or hash_opensubtitles(key)
+        if not hit or video.hashes != known:
+            with self._lock:
+                self._entries[key] = {
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "hashes": dict(video.hashes),
+                    "fingerprint": fingerprint,
+                }
+                self._dirty = True
+        return video, fingerprint
+
+
+class FingerprintStore(_JsonStore):
+    """Maps a video's OpenSubtitles hash to the first video path that got subtitles.
+
+    Hardlinks and copies share the hash, so their subtitles can be copied instead
+    of searched for again. Each source is stored with its size and mtime, and is
+    dropped once the file at that path has changed. A fingerprint being searched is
+    claimed, so a duplicate handled concurrently waits for that search rather than
+    querying providers too.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._claims: Dict[str, str] = {}
+        self._released = threading.Condition(self._lock)
+
+    def _current_source(self, fingerprint: str) -> Optional[str]:
+        """Return the recorded source path, dropping it if the file is gone or was replaced.
+
+        Must be called with the lock held.
+        """
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            return None
+        try:
+            st = os.stat(entry["path"])
+            if st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]:
+                return entry["path"]
+        except (OSError, KeyError, TypeError):
+            pass
+        del self._entries[fingerprint]
+        self._dirty = True
+        return None
+
+    def claim(self, fingerprint: str, vid_path: Path) -> Optional[str]:
+        """Return the video to copy subtitles from, or None once `vid_path` holds the claim."""
+        path = os.path.abspath(vid_path)
+        with self._released:
+            while self._claims.get(fingerprint, path) != path:
+                self._released.wait()
+            source = self._current_source(fingerprint)
+            if source and source != path:
+                return source
+            self._claims[fingerprint] = path
+            return None
+
+    def release(self, fingerprint: str, vid_path: Path, saved: bool) -> None:
+        """Drop the claim on `fingerprint`, recording `vid_path` as its source if it got subtitles."""
+        path = os.path.abspath(vid_path)
+        with self._released:
+            if self._claims.get(fingerprint) == path:
+                del self._claims[fingerprint]
+            # Keep the first source unless it has since been moved, deleted or replaced
+            if saved and self._current_source(fingerprint) is None:
+                st = os.stat(path)
+                self._entries[fingerprint] = {"path": path, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+                self._dirty = True
+            self._released.notify_all()
+
+
+class OutputWriter:
+    """Prints messages from worker threads on a single writer thread.
+
+    Workers only enqueue, so they never block on a slow terminal and lines never interleave.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="sublify-output", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while (msg := self._queue.get()) is not None:
+            click.echo(msg)
+
+    def echo(self, msg: str) -> None:
+        self._queue.put(msg)
+
+    def close(self) -> None:
+        """Flush pending messages and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+
+@dataclass(frozen=True)
+class _Job:
+    """Settings shared (read-only) by all video workers."""
+    langset: Set[Language]
+    lang_suffixes: Dict[Language, str]
+    providers: List[str]
+    provider_configs: Mapping[str, Mapping[str, str]]
+    providers_concurrent: Optional[int]
+    hi: bool
+    min_score: int
+    force: bool
+    dry_run: bool
+    delay: float
+    videos: VideoCache
+    fingerprints: FingerprintStore
+    listings: Dict[Path, FrozenSet[str]]
+    out: OutputWriter
+    stop: threading.Event
+
+
+def _reuse_duplicate_subtitles(vid_path: Path, source: str, needed: Set[Language],
+                               job: _Job) -> Set[Language]:
+    """Copy subtitles from `source`, an identical video; return the languages still missing."""
+    target = os.path.abspath(vid_path)
+    src_stem = os.path.splitext(source)[0]
+    dst_stem = os.path.splitext(target)[0]
+    remaining: Set[Language] = set()
+    for lang in needed:
+        suffix = job.lang_suffixes[lang]
+        src = src_stem + suffix
+        if not os.path.exists(src):
+            remaining.add(lang)
+        elif job.dry_run:
+            job.out.echo(f"  {vid_path.name}: [dry-run] would copy: {lang} from {Path(src).name}")
+        else:
+            shutil.copy2(src, dst_stem + suffix)
+            job.out.echo(f"  {vid_path.name}: Copied: {lang} from duplicate {Path(source).name}")
+    return remaining
+
+
+def _search_video(vid_path: Path, video: Video, needed: Set[Language], job: _Job,
+                  pool: AsyncProviderPool) -> Optional[bool]:
+    """Search `needed` languages for one scanned video through `pool` and save the best matches."""
+    job.out.echo(f"Searching: {vid_path.name}")
+    # Query all providers for this video at once instead of one after another
+    try:
+        subs = pool.download_best_subtitles(
+            pool.list_subtitles(video, needed),
+            video,
+            needed,
+            min_score=job.min_score,
+            hearing_impaired=job.hi,
+        )
+    finally:
+        # Only provider round-trips count towards rate limits
+        if job.delay > 0:
+            time.sleep(job.delay)
+
+    if not subs:
+        job.out.echo(f"  {vid_path.name}: No suitable subtitles found.")
+        return False
+
+    if job.dry_run:
+        for s in subs:
+            score = getattr(s, 'score', None)
+            score_txt = f" (score={score})" if score is not None else ""
+            prov = getattr(s, 'provider_name', getattr(s, 'provider', 'unknown'))
+            job.out.echo(f"  {vid_path.name}: [dry-run] would save: {s.language} from {prov}{score_txt}")
+        return None
+
+    save_subtitles(video, subs)
+    # Safely pick one for logging (no reliance on optional 'score')
+    best = max(subs, key=lambda x: getattr(x, 'score', 0))
+    prov = getattr(best, 'provider_name', getattr(best, 'provider', 'unknown'))
+    score = getattr(best, 'score', None)
+    score_txt = f" (score={score})" if score is not None else ""
+    job.out.echo(f"  {vid_path.name}: Saved: {best.language} from {prov}{score_txt}")
+    return True
+
+
+def _process_video(vid_path: Path, job: _Job, pool: AsyncProviderPool) -> Optional[bool]:
+    """Scan, search (through `pool`) and save subtitles for one video.
+
+    Returns True on success, False on failure and None when the video was skipped.
+    """
+    try:
+        needed = job.langset if job.force else missing_languages(vid_path, job.lang_suffixes, job.listings)
+        if not needed:
+            job.out.echo(f"[skip] {vid_path.name} — subtitles already exist. Use --force to overwrite.")
+            return None
+
+        video, fingerprint = job.videos.scan(vid_path, job.providers)
+        if not video:
+            job.out.echo(f"[warn] Could not parse video: {vid_path}")
+            return False
+
+        claimed = False
+        if fingerprint:
+            source = job.fingerprints.claim(fingerprint, vid_path)
+            if source:
+                needed = _reuse_duplicate_subtitles(vid_path, source, needed, job)
+                if not needed:
+                    return None if job.dry_run else True
+            else:
+                claimed = True
+
+        outcome = None
+        try:
+            outcome = _search_video(vid_path, video, needed, job, pool)
+        finally:
+            if claimed:
+                job.fingerprints.release(fingerprint, vid_path, saved=outcome is True)
+        return outcome
+
+    except Exception as e:
+        job.out.echo(f"[error] {vid_path.name}: {e}")
+        return False
+
+
+def _process_batch(batch: List[Path], job: _Job) -> List[Optional[bool]]:
+    """Process a batch of videos through one provider pool.
+
+    Providers are initialized (and logged in) once per batch rather than once per video.
+    A provider that failed for one video is restarted for the next, so a failure never
+    outlasts the video it happened on. Stops between videos once `job.stop` is set.
+    """
+    results: List[Optional[bool]] = []
+    with AsyncProviderPool(
+        max_workers=job.providers_concurrent,
+        providers=job.providers,
+        provider_configs=job.provider_configs,
+    ) as pool:
+        for vid_path in batch:
+            if job.stop.is_set():
+                break
+            # subliminal discards a failing provider for the pool's lifetime; undo that per video
+            for name in pool.discarded_providers:
+                if name in pool.initialized_providers:
+                    del pool[name]
+            pool.discarded_providers.clear()
+            results.append(_process_video(vid_path, job, pool))
+    return results
+
+
+def _batched(items: List[Path], size: int) -> Iterator[List[Path]]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 @click.command(context_settings={"help_option_names": ["-h", "--help"]})
 @click.argument("paths", nargs=-1, type=click.Path(path_type=Path, exists=True))
 @click.option(
@@ -139,9 +751,19 @@ def _lang_list_to_babelfish(langs: List[str]) -> Set[Language]:
 )
 @click.option("--force", is_flag=True, help="Overwrite existing subtitles if present.")
 @click.option("--dry-run", is_flag=True, help="Show what would be downloaded without saving.")
-@click.option("--delay", type=float, default=0.0, show_default=True, help="Delay seconds between videos (helps avoid rate limits).")
+@click.option("--delay", type=float, default=0.0, show_default=True,
+              help="Seconds each worker pauses after a provider search. Provider rate limits are "
+                   "already enforced per provider, so this is rarely needed.")
+@click.option("--concurrency", "--videos-concurrent", "-j", "concurrency", type=click.IntRange(min=1), default=8,
+              show_default=True, help="Number of videos to process in parallel.")
+@click.option("--providers-concurrent", type=click.IntRange(min=1), default=None,
+              help="Providers queried in parallel per video (default: all of them).")
+@click.option("--batch-size", type=click.IntRange(min=1), default=10, show_default=True,
+              help="Videos searched per provider session.")
+@click.option("--scan-threads", type=click.IntRange(min=1), default=16, show_default=True, help="Threads used to scan folders (helps on network shares).")
 def main(paths: List[Path], languages: List[str], recursive: bool, hi: bool, min_score: int,
-         providers: List[str], force: bool, dry_run: bool, delay: float):
+         providers: List[str], force: bool, dry_run: bool, delay: float, concurrency: int,
+         providers_concurrent: Optional[int], batch_size: int, scan_threads: int):
     """Download subtitles for files or folders.
 
     PATHS can be one or more files and/or directories.
@@ -150,82 +772,82 @@ def main(paths: List[Path], languages: List[str], recursive: bool, hi: bool, min
         click.echo("No paths provided. See --help for usage.")
         sys.exit(1)
 
+    # Computed once and shared read-only by all workers
+    providers_list = list(dict.fromkeys(providers))
+    providers_set = frozenset(providers_list)
+
     # Auth via environment variables (optional but helps with rate limits/accuracy)
-    provider_configs: Dict[str, dict] = {}
+    provider_configs: Dict[str, Mapping[str, str]] = {}
     ou = os.getenv("OPENSUBTITLES_USERNAME")
     op = os.getenv("OPENSUBTITLES_PASSWORD")
-    if ou and op:
-        provider_configs["opensubtitles"] = {"username": ou, "password": op}
+    if ou and op and "opensubtitles" in providers_set:
+        provider_configs["opensubtitles"] = MappingProxyType({"username": ou, "password": op})
+
+    configure_cache()
+    install_rate_limiter(RateLimiter(PROVIDER_RATE_LIMITS))
 
     # Prepare languages
     langset = _lang_list_to_babelfish(list(languages))
+    # str(Language) goes through babelfish converters; do it once, not per video
+    lang_str_map: Dict[Language, str] = {lang: str(lang) for lang in langset}
 
     # Collect videos
-    video_files = resolve_videos(paths, recursive)
+    listings: Dict[Path, FrozenSet[str]] = {}
+    video_files = resolve_videos(paths, recursive, scan_threads, listings)
     if not video_files:
         click.echo("No video files found.")
         sys.exit(2)
 
-    click.echo(f"Found {len(video_files)} video(s). Providers: {', '.join(providers)}. Languages: {', '.join(str(l) for l in langset)}")
+    click.echo(f"Found {len(video_files)} video(s). Providers: {', '.join(providers_list)}. Languages: {', '.join(lang_str_map.values())}")
 
-    # Process each video
+    # Process videos concurrently; each worker is dominated by provider network latency
     successes = 0
     failures = 0
 
-    for vid_path in video_files:
-        try:
-            if not force and has_existing_subtitles(vid_path, langset):
-                click.echo(f"[skip] {vid_path.name} — subtitles already exist. Use --force to overwrite.")
-                continue
-
-            video = scan_video(str(vid_path))
-            if not video:
-                click.echo(f"[warn] Could not parse video: {vid_path}")
-                failures += 1
-                continue
-
-            click.echo(f"Searching: {vid_path.name}")
-            subs_map = download_best_subtitles(
-                {video},
-                langset,
-                providers=list(providers),
-                provider_configs=provider_configs,
-                hearing_impaired=hi,
-                min_score=min_score,
-            )
-
-            subs = subs_map.get(video, set())
-            if not subs:
-                click.echo("  No suitable subtitles found.")
-                failures += 1
-            else:
-                if dry_run:
-                    for s in subs:
-                        score = getattr(s, 'score', None)
-                        score_txt = f" (score={score})" if score is not None else ""
-                        prov = getattr(s, 'provider_name', getattr(s, 'provider', 'unknown'))
-                        click.echo(f"  [dry-run] would save: {s.language} from {prov}{score_txt}")
-                else:
-                    save_subtitles(video, subs)
-                    # Safely pick one for logging (no reliance on optional 'score')
-                    def score_of(x):
-                        return getattr(x, 'score', 0)
-                    best = sorted(subs, key=score_of, reverse=True)[0]
-                    prov = getattr(best, 'provider_name', getattr(best, 'provider', 'unknown'))
-                    score = getattr(best, 'score', None)
-                    score_txt = f" (score={score})" if score is not None else ""
-                    click.echo(f"  Saved: {best.language} from {prov}{score_txt}")
+    job = _Job(
+        langset=langset,
+        lang_suffixes={lang: f".{code}.srt" for lang, code in lang_str_map.items()},
+        providers=providers_list,
+        provider_configs=MappingProxyType(provider_configs),
+        providers_concurrent=providers_concurrent,
+        hi=hi,
+        min_score=min_score,
+        force=force,
+        dry_run=dry_run,
+        delay=delay,
+        videos=VideoCache(CACHE_DIR / "videos.json"),
+        fingerprints=FingerprintStore(CACHE_DIR / "fingerprints.json"),
+        listings=listings,
+        out=OutputWriter(),
+        stop=threading.Event(),
+    )
+
+    # Keep every worker busy: shrink batches when there are few videos
+    workers = concurrency
+    batch_size = min(batch_size, -(-len(video_files) // workers))
+
+    interrupted = False
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_process_batch, batch, job) for batch in _batched(video_files, batch_size)]
+        for fut in as_completed(futures):
+            for outcome in fut.result():
+                if outcome is True:
                     successes += 1
-
-            if delay > 0:
-                time.sleep(delay)
-
-        except KeyboardInterrupt:
-            click.echo("Interrupted by user.")
-            sys.exit(130)
-        except Exception as e:
-            failures += 1
-            click.echo(f"[error] {vid_path.name}: {e}")
+                elif outcome is False:
+                    failures += 1
+    except KeyboardInterrupt:
+        interrupted = True
+        job.stop.set()
+        job.out.echo("Interrupted by user. Finishing videos in progress...")
+    finally:
+        # Workers may still write to the caches and the output queue until they exit
+        executor.shutdown(wait=True, cancel_futures=True)
+        job.videos.save()
+        job.fingerprints.save()
+        job.out.close()
+    if interrupted:
+        sys.exit(130)
 
     click.echo(f"\nDone. Success: {successes}, Failures: {failures}")
     sys.exit(0 if successes > 0 and failures == 0 else (1 if successes == 0 else 0))